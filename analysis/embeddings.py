@@ -0,0 +1,67 @@
+"""
+Bulk embedding helpers.
+
+Loads embeddings for many ProcessedFeedback rows into one contiguous
+NumPy matrix (structure-of-arrays) so similarity math runs as a single
+vectorized BLAS call instead of per-row Python loops over JSON lists.
+"""
+
+import numpy as np
+
+# Must match AIProcessor: all-MiniLM-L6-v2 output, int8-quantized
+EMBEDDING_DIM = 384
+EMBEDDING_SCALE = 127.0
+
+
+def embeddings_matrix(queryset):
+    """
+    Load embeddings for a ProcessedFeedback queryset as one matrix.
+
+    Args:
+        queryset: ProcessedFeedback queryset (filters already applied)
+
+    Returns:
+        (ids, matrix) where ids is an int64 array of primary keys and
+        matrix is a float32 (N, 384) array with quantization undone
+    """
+    ids = []
+    vectors = []
+
+    rows = queryset.values_list('id', 'embeddings').iterator(chunk_size=2000)
+    for pk, vector in rows:
+        # Skip rows written before embeddings existed or with a
+        # different model dimension
+        if vector and len(vector) == EMBEDDING_DIM:
+            ids.append(pk)
+            vectors.append(vector)
+
+    if not vectors:
+        return (
+            np.array([], dtype=np.int64),
+            np.empty((0, EMBEDDING_DIM), dtype=np.float32)
+        )
+
+    # One allocation for the whole batch, dequantized in C
+    matrix = np.asarray(vectors, dtype=np.float32) / EMBEDDING_SCALE
+
+    return np.asarray(ids, dtype=np.int64), matrix
+
+
+def cosine_similarities(matrix, query_vector):
+    """
+    Cosine similarity of every row in matrix against one query vector.
+
+    Args:
+        matrix: float32 (N, 384) array from embeddings_matrix
+        query_vector: iterable of 384 floats (unquantized)
+
+    Returns:
+        float32 array of N similarity scores
+    """
+    query = np.asarray(query_vector, dtype=np.float32)
+
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    # Avoid division by zero for degenerate vectors
+    norms[norms == 0] = 1.0
+
+    return (matrix @ query) / norms
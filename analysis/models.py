@@ -1,4 +1,7 @@
 from django.db import models
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from data_ingestion.models import RawFeed
 
 
@@ -29,6 +32,17 @@ class ProcessedFeedback(models.Model):
         help_text="Original raw feedback"
     )
     
+    # Denormalized from raw_feed.entity.owner at write time so the
+    # permission filter is one indexed equality instead of two JOINs
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='processed_feedbacks',
+        null=True,
+        blank=True,
+        help_text="Owner of the entity this feedback belongs to"
+    )
+
     # Sentiment Analysis (Day 8)
     sentiment = models.CharField(
         max_length=20,
@@ -48,7 +62,7 @@ class ProcessedFeedback(models.Model):
     # Embeddings (Day 11)
     embeddings = models.JSONField(
         default=list,
-        help_text="Vector embeddings (384-dimensional)"
+        help_text="Vector embeddings (384-dimensional, int8-quantized)"
     )
     
     # Summarization (Day 10)
@@ -64,6 +78,14 @@ class ProcessedFeedback(models.Model):
         help_text="Important phrases extracted"
     )
     
+    # Full-text search vector over raw text + summary, maintained by
+    # the processing task and probed via the GIN index below
+    search_vector = SearchVectorField(
+        null=True,
+        blank=True,
+        help_text="tsvector for full-text search"
+    )
+
     # Urgency Classification (Bonus)
     urgency = models.CharField(
         max_length=20,
@@ -98,6 +120,12 @@ class ProcessedFeedback(models.Model):
             models.Index(fields=['sentiment', 'processed_at']),
             models.Index(fields=['urgency', 'processed_at']),
             models.Index(fields=['sentiment_score']),
+            models.Index(fields=['owner', 'processed_at']),
+            # GIN indexes so topics__contains / key_phrases lookups
+            # become index lookups instead of sequential scans
+            GinIndex(fields=['topics']),
+            GinIndex(fields=['key_phrases']),
+            GinIndex(fields=['search_vector']),
         ]
         verbose_name = "Processed Feedback"
         verbose_name_plural = "Processed Feedbacks"
@@ -119,4 +147,31 @@ class ProcessedFeedback(models.Model):
     
     @property
     def embedding_dimension(self):
-        return len(self.embeddings) if self.embeddings else 0
\ No newline at end of file
+        return len(self.embeddings) if self.embeddings else 0
+
+
+class SentimentDaily(models.Model):
+    """
+    Read-only mapping of the mv_sentiment_daily materialized view.
+
+    Pre-aggregated per (entity, day, sentiment) by the
+    refresh_sentiment_daily_mv Celery task for dashboard reads.
+    """
+
+    # Synthetic key from row_number(): entity_id repeats across
+    # day/sentiment rows, so it can't be the pk
+    row_id = models.BigIntegerField(primary_key=True)
+    entity_id = models.BigIntegerField()
+    day = models.DateTimeField()
+    sentiment = models.CharField(max_length=20)
+    feedback_count = models.BigIntegerField()
+    avg_score = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'mv_sentiment_daily'
+        verbose_name = "Sentiment Daily Rollup"
+        verbose_name_plural = "Sentiment Daily Rollups"
+
+    def __str__(self):
+        return f"Entity #{self.entity_id} - {self.day:%Y-%m-%d} - {self.sentiment}"
\ No newline at end of file
@@ -30,9 +30,11 @@ class ProcessedFeedbackListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for list views"""
     
     entity_name = serializers.CharField(source='raw_feed.entity.name', read_only=True)
-    text_preview = serializers.SerializerMethodField()
+    # Populated by the queryset annotation (SQL substring) so the full
+    # text column is never fetched for list rows
+    text_preview = serializers.CharField(read_only=True)
     sentiment_display = serializers.CharField(source='get_sentiment_display', read_only=True)
-    
+
     class Meta:
         model = ProcessedFeedback
         fields = [
@@ -40,10 +42,6 @@ class ProcessedFeedbackListSerializer(serializers.ModelSerializer):
             'sentiment', 'sentiment_display', 'sentiment_score',
             'topics', 'processed_at'
         ]
-    
-    def get_text_preview(self, obj):
-        text = obj.raw_feed.text
-        return text[:80] + '...' if len(text) > 80 else text
 
 
 class SentimentStatsSerializer(serializers.Serializer):
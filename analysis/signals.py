@@ -0,0 +1,23 @@
+"""
+Cache invalidation signals for the analysis app.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import ProcessedFeedback
+
+# Version key baked into sentiment_stats cache keys; bumping it
+# invalidates every cached variant without pattern deletes
+SENTIMENT_STATS_VERSION_KEY = 'sentiment_stats:version'
+
+
+@receiver(post_save, sender=ProcessedFeedback)
+@receiver(post_delete, sender=ProcessedFeedback)
+def bust_sentiment_stats_cache(sender, **kwargs):
+    """Invalidate cached sentiment_stats responses when rows change"""
+    try:
+        cache.incr(SENTIMENT_STATS_VERSION_KEY)
+    except ValueError:
+        cache.set(SENTIMENT_STATS_VERSION_KEY, 1, timeout=None)
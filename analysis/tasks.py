@@ -0,0 +1,189 @@
+"""
+Celery tasks for the analysis app.
+"""
+
+from celery import shared_task
+from django.db import connection
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== SENTIMENT DAILY MATERIALIZED VIEW ====================
+
+# Pre-aggregated counts/avg per (entity, day, sentiment) so dashboards
+# read a few hundred rows instead of scanning every processed feedback.
+# Migrations are not committed in this tree, so the DDL is applied
+# idempotently by the refresh task itself.
+
+CREATE_MV_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_sentiment_daily AS
+SELECT row_number() OVER () AS row_id,
+       rf.entity_id,
+       date_trunc('day', pf.processed_at) AS day,
+       pf.sentiment,
+       count(*) AS feedback_count,
+       avg(pf.sentiment_score) AS avg_score
+FROM analysis_processedfeedback pf
+JOIN data_ingestion_rawfeed rf ON pf.raw_feed_id = rf.id
+GROUP BY 2, 3, 4
+"""
+
+# The view holds one row per (entity, day, sentiment); row_id is a
+# synthetic key so the ORM mapping has a real primary key. Detects a
+# pre-row_id deployment of the view and rebuilds it.
+HAS_ROW_ID_SQL = """
+SELECT 1 FROM pg_attribute a
+JOIN pg_class c ON c.oid = a.attrelid
+WHERE c.relname = %s AND a.attname = 'row_id'
+"""
+
+CREATE_MV_INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS mv_sentiment_daily_uniq
+ON mv_sentiment_daily (entity_id, day, sentiment)
+"""
+
+
+@shared_task
+def refresh_sentiment_daily_mv():
+    """
+    Create (if missing) and refresh the mv_sentiment_daily view.
+    Runs every 5 minutes via Celery Beat.
+    """
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(HAS_ROW_ID_SQL, ['mv_sentiment_daily'])
+            if cursor.fetchone() is None:
+                cursor.execute(
+                    "DROP MATERIALIZED VIEW IF EXISTS mv_sentiment_daily"
+                )
+            cursor.execute(CREATE_MV_SQL)
+            cursor.execute(CREATE_MV_INDEX_SQL)
+            # CONCURRENTLY keeps readers unblocked during the refresh
+            cursor.execute(
+                "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_sentiment_daily"
+            )
+
+        logger.info("✅ Refreshed mv_sentiment_daily")
+        return {'status': 'success'}
+
+    except Exception as e:
+        logger.error(f"Error refreshing mv_sentiment_daily: {str(e)}")
+        return {'status': 'error', 'message': str(e)}
+
+
+# ==================== STORAGE TUNING ====================
+
+@shared_task
+def tune_embeddings_storage():
+    """
+    One-off tuning of TOAST handling for the embeddings column.
+
+    LZ4 decompresses 2-3x faster than the default pglz on Postgres 14+,
+    which matters whenever rows with embeddings are de-TOASTed. Run
+    manually (or after a fresh migrate); only affects newly written
+    rows, existing tuples are rewritten by routine VACUUM FULL / dumps.
+    """
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "ALTER TABLE analysis_processedfeedback "
+                "ALTER COLUMN embeddings SET COMPRESSION lz4"
+            )
+
+        logger.info("✅ embeddings column switched to lz4 compression")
+        return {'status': 'success'}
+
+    except Exception as e:
+        logger.error(f"Error tuning embeddings storage: {str(e)}")
+        return {'status': 'error', 'message': str(e)}
+
+# ==================== SEARCH VECTOR BACKFILL ====================
+
+@shared_task
+def backfill_search_vectors(batch_size=5000):
+    """
+    One-off backfill of search_vector for rows processed before the
+    stored-tsvector change (they have NULL vectors and never match
+    ?search=). Run manually after deploy; idempotent and chunked so it
+    never holds a long row lock. Uses the same 'english' config as the
+    processing tasks and the search view.
+    """
+    total = 0
+    try:
+        while True:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE analysis_processedfeedback AS pf
+                    SET search_vector = to_tsvector(
+                        'english',
+                        rf.text || ' ' || COALESCE(pf.summary, '')
+                    )
+                    FROM data_ingestion_rawfeed AS rf
+                    WHERE rf.id = pf.raw_feed_id
+                      AND pf.id IN (
+                          SELECT id FROM analysis_processedfeedback
+                          WHERE search_vector IS NULL
+                          LIMIT %s
+                      )
+                    """,
+                    [batch_size]
+                )
+                updated = cursor.rowcount
+
+            total += updated
+            if updated < batch_size:
+                break
+
+        logger.info("✅ Backfilled search_vector on %s rows", total)
+        return {'status': 'success', 'updated': total}
+
+    except Exception as e:
+        logger.exception("Error backfilling search vectors")
+        return {'status': 'error', 'message': str(e), 'updated': total}
+
+# ==================== OWNER BACKFILL ====================
+
+@shared_task
+def backfill_processed_feedback_owner(batch_size=5000):
+    """
+    One-off backfill of the denormalized owner column.
+
+    Rows processed before owner was denormalized have NULL owner and
+    fall out of the owner_id permission filter, hiding them from
+    non-admins. Run manually after deploy; idempotent and chunked like
+    backfill_search_vectors.
+    """
+    total = 0
+    try:
+        while True:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE analysis_processedfeedback AS pf
+                    SET owner_id = be.owner_id
+                    FROM data_ingestion_rawfeed AS rf
+                    JOIN data_ingestion_businessentity AS be
+                      ON be.id = rf.entity_id
+                    WHERE rf.id = pf.raw_feed_id
+                      AND pf.id IN (
+                          SELECT id FROM analysis_processedfeedback
+                          WHERE owner_id IS NULL
+                          LIMIT %s
+                      )
+                    """,
+                    [batch_size]
+                )
+                updated = cursor.rowcount
+
+            total += updated
+            if updated < batch_size:
+                break
+
+        logger.info("✅ Backfilled owner on %s processed feedbacks", total)
+        return {'status': 'success', 'updated': total}
+
+    except Exception as e:
+        logger.exception("Error backfilling processed feedback owners")
+        return {'status': 'error', 'message': str(e), 'updated': total}
@@ -3,21 +3,44 @@ from django.shortcuts import render
 # Create your views here.
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Count, Avg, Q
+from django.db import DatabaseError
+from django.db.models import Count, Avg, F, Q
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Substr
 from .models import ProcessedFeedback
 from .serializers import (
     ProcessedFeedbackSerializer,
     ProcessedFeedbackListSerializer,
     SentimentStatsSerializer
 )
+from django.core.cache import cache
+from django.contrib.postgres.search import SearchQuery
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from .signals import SENTIMENT_STATS_VERSION_KEY
 from data_ingestion.tasks import reprocess_failed_feedbacks
+from urllib.parse import urlencode
+from collections import Counter
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class ProcessedFeedbackCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the indexed processed_at column.
+
+    LIMIT/OFFSET degrades linearly with page depth; a cursor keeps every
+    page an index range scan.
+    """
+    ordering = '-processed_at'
+    page_size = 50
+
+
 class ProcessedFeedbackViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing processed feedbacks.
@@ -26,8 +49,8 @@ class ProcessedFeedbackViewSet(viewsets.ReadOnlyModelViewSet):
     retrieve: GET /api/analysis/processed-feedbacks/{id}/
     """
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['raw_feed__text', 'summary', 'topics']
+    pagination_class = ProcessedFeedbackCursorPagination
+    filter_backends = [filters.OrderingFilter]
     ordering_fields = ['processed_at', 'sentiment_score']
     ordering = ['-processed_at']
     
@@ -35,23 +58,76 @@ class ProcessedFeedbackViewSet(viewsets.ReadOnlyModelViewSet):
         if self.action == 'list':
             return ProcessedFeedbackListSerializer
         return ProcessedFeedbackSerializer
-    
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # Evaluate the role check once per request; today is_admin is a
+        # plain column property, but this keeps any future role/group
+        # lookup from firing on every access in the handlers below
+        request.is_admin = request.user.is_admin
+
     def get_queryset(self):
         user = self.request.user
-        
-        # Base queryset with optimized joins
-        queryset = ProcessedFeedback.objects.select_related(
-            'raw_feed',
-            'raw_feed__entity',
-            'raw_feed__entity__owner'
-        )
-        
-        # Filter by user permissions
-        if not user.is_admin:
-            queryset = queryset.filter(raw_feed__entity__owner=user)
-        
+
+        if self.action == 'list':
+            # The list endpoint is rendered as a plain values()
+            # projection (see list()), so only the SQL preview
+            # annotation is needed here - heavy columns are never
+            # selected at all
+            # 81 chars on purpose: the spare char tells us whether the
+            # text was truncated so the ellipsis below matches the old
+            # serializer output (same trick as the RawFeed list)
+            queryset = ProcessedFeedback.objects.annotate(
+                text_preview=Substr('raw_feed__text', 1, 81)
+            )
+        else:
+            # Joined queryset for detail/stats actions. The owner hop is
+            # left out on purpose: the permission filter only needs
+            # owner_id in the WHERE clause and no serializer renders
+            # User columns
+            queryset = ProcessedFeedback.objects.select_related(
+                'raw_feed',
+                'raw_feed__entity'
+            )
+
+        # Filter by user permissions (denormalized owner column, no JOINs)
+        if not self.request.is_admin:
+            queryset = queryset.filter(owner_id=user.id)
+
         # Apply filters
         return self._apply_filters(queryset)
+
+    # Choice labels resolved once instead of per-row display calls
+    _SENTIMENT_LABELS = dict(ProcessedFeedback.SENTIMENT_CHOICES)
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serve list responses as a plain .values() projection.
+
+        Skips per-row model instantiation and serializer field
+        traversal; the shape matches ProcessedFeedbackListSerializer.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            'id', 'raw_feed', 'sentiment', 'sentiment_score',
+            'topics', 'processed_at', 'text_preview',
+            entity_name=F('raw_feed__entity__name'),
+        )
+
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else list(queryset)
+
+        for row in rows:
+            preview = row['text_preview'] or ''
+            row['text_preview'] = (
+                preview[:80] + '...' if len(preview) > 80 else preview
+            )
+            row['sentiment_display'] = self._SENTIMENT_LABELS.get(
+                row['sentiment'], row['sentiment']
+            )
+
+        if page is not None:
+            return self.get_paginated_response(rows)
+        return Response(rows)
     
     def _apply_filters(self, queryset):
         """Apply query parameter filters"""
@@ -69,23 +145,50 @@ class ProcessedFeedbackViewSet(viewsets.ReadOnlyModelViewSet):
         # Filter by minimum sentiment score
         min_score = self.request.query_params.get('min_score')
         if min_score:
-            queryset = queryset.filter(sentiment_score__gte=float(min_score))
-        
+            try:
+                min_score = float(min_score)
+            except ValueError:
+                raise ValidationError({'min_score': 'Must be a number.'})
+            queryset = queryset.filter(sentiment_score__gte=min_score)
+
         # Filter by topic
         topic = self.request.query_params.get('topic')
         if topic:
             queryset = queryset.filter(topics__contains=[topic])
-        
-        # Filter by date range
-        start_date = self.request.query_params.get('start_date')
+
+        # Full-text search via the stored tsvector (GIN index probe
+        # instead of ILIKE scans over three joined columns)
+        search = self.request.query_params.get('search')
+        if search:
+            # config must match what the tasks store, or the query
+            # tsquery and stored tsvectors stem differently
+            queryset = queryset.filter(
+                search_vector=SearchQuery(search, config='english')
+            )
+
+        # Filter by date range - parse once so the ORM binds a native
+        # datetime (keeps the processed_at index usable) and bad input
+        # fails fast with a 400 instead of a DB error
+        start_date = self._parse_date_param('start_date')
         if start_date:
             queryset = queryset.filter(processed_at__gte=start_date)
-        
-        end_date = self.request.query_params.get('end_date')
+
+        end_date = self._parse_date_param('end_date')
         if end_date:
             queryset = queryset.filter(processed_at__lte=end_date)
-        
+
         return queryset
+
+    def _parse_date_param(self, param):
+        """Parse an ISO date/datetime query param, 400 on invalid input"""
+        value = self.request.query_params.get(param)
+        if not value:
+            return None
+
+        parsed = parse_datetime(value) or parse_date(value)
+        if parsed is None:
+            raise ValidationError({param: 'Must be an ISO date or datetime.'})
+        return parsed
     
     @action(detail=False, methods=['get'])
     def sentiment_stats(self, request):
@@ -98,68 +201,82 @@ class ProcessedFeedbackViewSet(viewsets.ReadOnlyModelViewSet):
         - start_date: Filter by start date
         - end_date: Filter by end date
         """
+        # Dashboards hammer this endpoint while the underlying rows only
+        # change when Celery writes - serve from cache when possible
+        params = urlencode(sorted(self.request.query_params.items()))
+        version = cache.get(SENTIMENT_STATS_VERSION_KEY, 0)
+        cache_key = (
+            f"sentiment_stats:{request.user.id}:{version}:"
+            f"{hashlib.md5(params.encode()).hexdigest()}"
+        )
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
         queryset = self.get_queryset()
-        
-        total = queryset.count()
-        
+
+        # Single aggregate with FILTER clauses - one scan instead of
+        # a count + GROUP BY + aggregate round-trip per statistic
+        counts = queryset.aggregate(
+            total=Count('id'),
+            positive=Count('id', filter=Q(sentiment='positive')),
+            neutral=Count('id', filter=Q(sentiment='neutral')),
+            negative=Count('id', filter=Q(sentiment='negative')),
+            avg_score=Avg('sentiment_score')
+        )
+
+        total = counts['total']
+
         if total == 0:
             return Response({
                 'total_processed': 0,
                 'message': 'No processed feedbacks found'
             })
-        
-        # Count by sentiment
-        sentiment_counts = queryset.values('sentiment').annotate(
-            count=Count('id')
-        )
-        
-        positive_count = next(
-            (item['count'] for item in sentiment_counts if item['sentiment'] == 'positive'),
-            0
-        )
-        neutral_count = next(
-            (item['count'] for item in sentiment_counts if item['sentiment'] == 'neutral'),
-            0
-        )
-        negative_count = next(
-            (item['count'] for item in sentiment_counts if item['sentiment'] == 'negative'),
-            0
-        )
-        
+
         # Calculate percentages
         stats = {
             'total_processed': total,
-            'positive_count': positive_count,
-            'neutral_count': neutral_count,
-            'negative_count': negative_count,
-            'positive_percentage': (positive_count / total * 100) if total > 0 else 0,
-            'neutral_percentage': (neutral_count / total * 100) if total > 0 else 0,
-            'negative_percentage': (negative_count / total * 100) if total > 0 else 0,
-            'average_sentiment_score': queryset.aggregate(
-                avg=Avg('sentiment_score')
-            )['avg'] or 0,
+            'positive_count': counts['positive'],
+            'neutral_count': counts['neutral'],
+            'negative_count': counts['negative'],
+            'positive_percentage': counts['positive'] / total * 100,
+            'neutral_percentage': counts['neutral'] / total * 100,
+            'negative_percentage': counts['negative'] / total * 100,
+            'average_sentiment_score': counts['avg_score'] or 0,
             'topic_breakdown': self._get_topic_breakdown(queryset)
         }
         
         serializer = SentimentStatsSerializer(stats)
+        cache.set(cache_key, serializer.data, 60)
         return Response(serializer.data)
-    
+
     def _get_topic_breakdown(self, queryset):
-        """Get breakdown of topics from processed feedbacks"""
-        topic_counts = {}
-        
-        for feedback in queryset:
-            for topic in feedback.topics:
-                topic_counts[topic] = topic_counts.get(topic, 0) + 1
-        
-        # Sort by count and return top 10
-        sorted_topics = sorted(
-            topic_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
-        
-        return dict(sorted_topics)
+        """Get breakdown of topics from processed feedbacks (top 10)"""
+        try:
+            # Unnest the JSONB topics array and count server-side so
+            # only 10 (topic, count) rows come back instead of every row
+            rows = (
+                queryset
+                .annotate(topic=RawSQL("jsonb_array_elements_text(topics)", []))
+                .values('topic')
+                .annotate(count=Count('id'))
+                .order_by('-count')
+                .values_list('topic', 'count')[:10]
+            )
+            return dict(rows)
+
+        except DatabaseError:
+            # Backends without jsonb unnest (e.g. SQLite in tests):
+            # stream just the topics column and count in C via Counter
+            counter = Counter()
+            topics_iter = queryset.values_list(
+                'topics', flat=True
+            ).iterator(chunk_size=2000)
+            for topics in topics_iter:
+                counter.update(topics or ())
+
+            return dict(counter.most_common(10))
     
     @action(detail=False, methods=['post'])
     def reprocess_failed(self, request):
@@ -168,18 +285,34 @@ class ProcessedFeedbackViewSet(viewsets.ReadOnlyModelViewSet):
         
         POST /api/analysis/processed-feedbacks/reprocess_failed/
         """
-        if not request.user.is_admin:
+        if not request.is_admin:
             return Response(
                 {'error': 'Only admins can trigger reprocessing'},
                 status=status.HTTP_403_FORBIDDEN
             )
-        
-        # Trigger Celery task
-        task = reprocess_failed_feedbacks.delay()
-        
+
+        # Coalesce repeated admin clicks - one queued run is enough
+        if not cache.add('reprocess_failed:queued', 1, timeout=300):
+            return Response(
+                {'message': 'Reprocessing already queued'},
+                status=status.HTTP_202_ACCEPTED
+            )
+
+        # Fire and forget: retry=False keeps a flaky broker from tying
+        # up the request worker on reconnect loops
+        try:
+            task = reprocess_failed_feedbacks.apply_async(retry=False)
+        except Exception as e:
+            cache.delete('reprocess_failed:queued')
+            logger.error(f"Failed to queue reprocess task: {str(e)}")
+            return Response(
+                {'error': 'Could not queue reprocessing task'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
         logger.info(f"Reprocess task triggered by {request.user.username}")
-        
+
         return Response({
             'message': 'Reprocessing task triggered',
             'task_id': task.id
-        })
\ No newline at end of file
+        }, status=status.HTTP_202_ACCEPTED)
\ No newline at end of file
@@ -2,6 +2,7 @@ from __future__ import absolute_import, unicode_literals
 import os
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 # Set default Django settings
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
@@ -15,12 +16,11 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Auto-discover tasks from all installed apps
 app.autodiscover_tasks()
 
-# Configure periodic tasks
+# Configure periodic tasks.
+# The old 10-second print_random_feedback entry was removed: ~8,640
+# broker round-trips a day just to log a row. Invoke the task manually
+# when debugging instead.
 app.conf.beat_schedule = {
-    'print-feedback-every-10-seconds': {
-        'task': 'data_ingestion.tasks.print_random_feedback',
-        'schedule': 10.0,  # Every 10 seconds
-    },
     'process-pending-feedbacks-every-minute': {
         'task': 'data_ingestion.tasks.process_pending_feedbacks',
         'schedule': 60.0,  # Every 1 minute
@@ -29,8 +29,28 @@ app.conf.beat_schedule = {
         'task': 'data_ingestion.tasks.cleanup_old_feedbacks',
         'schedule': crontab(hour=2, minute=0),  # Every day at 2 AM
     },
+    'refresh-sentiment-daily-mv': {
+        'task': 'analysis.tasks.refresh_sentiment_daily_mv',
+        'schedule': 300.0,  # Every 5 minutes
+    },
+    'refresh-feedback-daily-mv': {
+        'task': 'data_ingestion.tasks.refresh_feedback_daily_mv',
+        'schedule': 300.0,  # Every 5 minutes
+    },
 }
 
+@worker_process_init.connect
+def preload_ai_models(**kwargs):
+    """
+    Load the AI models while the worker process boots.
+
+    The processor is a per-process singleton; warming it here means the
+    first real feedback task doesn't eat the multi-second model load.
+    """
+    from analysis.ai_processor import get_ai_processor
+    get_ai_processor()
+
+
 @app.task(bind=True)
 def debug_task(self):
     """Debug task to test Celery is working"""
@@ -4,16 +4,30 @@ Custom exception handler for consistent API error responses.
 
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
+from rest_framework.exceptions import (
+    NotAuthenticated,
+    AuthenticationFailed,
+    PermissionDenied,
+    ValidationError,
+)
 from rest_framework import status
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Routine 4xx in a healthy API - logged at debug, not error
+_EXPECTED_CLIENT_ERRORS = (
+    NotAuthenticated,
+    AuthenticationFailed,
+    PermissionDenied,
+    ValidationError,
+)
+
 
 def custom_exception_handler(exc, context):
     """
     Custom exception handler that provides consistent error responses.
-    
+
     Returns:
         Response with standardized error format:
         {
@@ -24,52 +38,67 @@ def custom_exception_handler(exc, context):
     """
     # Call REST framework's default exception handler first
     response = exception_handler(exc, context)
-    
-    # Log the exception
-    view = context.get('view')
-    request = context.get('request')
-    
+
     if response is not None:
         # Standardize the error response format
         error_data = {
             'error': str(exc),
             'status_code': response.status_code
         }
-        
+
         # Add detail if available
-        if hasattr(response, 'data'):
-            if isinstance(response.data, dict):
-                error_data['detail'] = response.data
+        data = getattr(response, 'data', None)
+        if data is not None:
+            if isinstance(data, dict):
+                error_data['detail'] = data
             else:
-                error_data['detail'] = {'message': response.data}
-        
+                error_data['detail'] = {'message': data}
+
         response.data = error_data
-        
-        # Log error
+
+        # Expected client errors (auth failures, bad input) fire
+        # constantly - skip the error log and its string building
+        if isinstance(exc, _EXPECTED_CLIENT_ERRORS):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "API client error: %s | Path: %s",
+                    error_data['error'],
+                    context['request'].path if context.get('request') else 'N/A'
+                )
+            return response
+
+        # Log error (lazy %-formatting, no work if the level is off)
+        view = context.get('view')
+        request = context.get('request')
         logger.error(
-            f"API Error: {error_data['error']} | "
-            f"View: {view.__class__.__name__} | "
-            f"Path: {request.path if request else 'N/A'}"
+            "API Error: %s | View: %s | Path: %s",
+            error_data['error'],
+            view.__class__.__name__ if view else 'N/A',
+            request.path if request else 'N/A'
         )
     else:
         # Handle non-DRF exceptions
+        view = context.get('view')
+        request = context.get('request')
+
         error_data = {
             'error': 'Internal server error',
             'detail': str(exc),
             'status_code': status.HTTP_500_INTERNAL_SERVER_ERROR
         }
-        
+
         response = Response(
             error_data,
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
-        
+
         # Log critical error
         logger.critical(
-            f"Unhandled Exception: {str(exc)} | "
-            f"View: {view.__class__.__name__ if view else 'N/A'} | "
-            f"Path: {request.path if request else 'N/A'}",
+            "Unhandled Exception: %s | View: %s | Path: %s",
+            str(exc),
+            view.__class__.__name__ if view else 'N/A',
+            request.path if request else 'N/A',
             exc_info=True
         )
-    
-    return response
\ No newline at end of file
+
+    return response
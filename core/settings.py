@@ -161,7 +161,8 @@ AUTH_USER_MODEL = 'users.User'
 # adding Authorization and Authentication settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # JWTAuthentication plus a 30s user-row cache
+        'users.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
@@ -192,13 +193,6 @@ SIMPLE_JWT = {
 }
 
 
-# ADDING DEFAULT URL FOR CODE SPACE
-SWAGGER_SETTINGS = {
-    'DEFAULT_API_URL': 'https://glowing-robot-v6v49gg4g4w92x5xw-8000.app.github.dev',
-}
-
-
-
 # adding Celery settings
 # CELERY_BROKER_URL = ""
 # CELERY_RESULT_BACKEND = ""
@@ -211,6 +205,20 @@ SWAGGER_SETTINGS = {
 
 
 
+# ==================== CACHE CONFIGURATION ====================
+# Redis cache for hot endpoint responses (shares the Celery Redis)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv("RAILWAY_REDIS_URL"),
+    }
+}
+
+# ==================== END CACHE CONFIGURATION ====================
+
+
+
 # ==================== CELERY CONFIGURATION ====================
 # Add these settings to your core/settings.py file
 
@@ -235,7 +243,11 @@ CELERY_RESULT_EXPIRES = 3600  # 1 hour
 CELERY_RESULT_PERSISTENT = True
 
 # Celery Worker Settings
-CELERY_WORKER_PREFETCH_MULTIPLIER = 4
+# Prefetch 1 + late acks: AI tasks run for seconds, so letting a worker
+# reserve 4 of them just queues short tasks behind long ones
+# (head-of-line blocking). Pair with -Ofair on the worker command line.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ACKS_LATE = True
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 1000
 
 # Don't run tasks eagerly during development (set to False)
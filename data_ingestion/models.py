@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.functions import Lower
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.conf import settings
 
@@ -31,21 +33,17 @@ class BusinessEntity(models.Model):
         indexes = [
             models.Index(fields=['owner', 'is_active']),
         ]
+        constraints = [
+            # Case-insensitive uniqueness enforced by the index itself,
+            # so serializers don't need a pre-check query
+            models.UniqueConstraint(
+                Lower('name'),
+                name='uniq_entity_name_ci'
+            ),
+        ]
 
     def __str__(self):
         return self.name
-    
-    @property
-    def total_feedbacks(self):
-        return self.raw_feeds.count()
-    
-    @property
-    def new_feedbacks(self):
-        return self.raw_feeds.filter(status='new').count()
-    
-    @property
-    def processed_feedbacks(self):
-        return self.raw_feeds.filter(status='processed').count()
 
 
 class RawFeed(models.Model):
@@ -154,9 +152,48 @@ class RawFeed(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['entity', 'status']),
+            # Index-only scans for the per-entity stats breakdowns; the
+            # products one is partial since the aggregate filters out
+            # NULL product names anyway
+            models.Index(fields=['entity', 'source']),
+            models.Index(
+                fields=['entity', 'product_name'],
+                condition=models.Q(product_name__isnull=False),
+                name='idx_entity_product_notnull'
+            ),
+            models.Index(fields=['entity', 'created_at']),
             models.Index(fields=['source', 'created_at']),
             models.Index(fields=['status', 'created_at']),
+            # The chunked cleanup loop repeatedly scans
+            # status='processed' AND processed_at < cutoff
+            models.Index(fields=['status', 'processed_at']),
             models.Index(fields=['product_name']),
+            # Covers the daily-report aggregate (today's rows grouped by
+            # status/source) with an index-only scan
+            models.Index(fields=['created_at', 'status', 'source']),
+            # Trigram GIN indexes so the unanchored ILIKE '%...%'
+            # filters and SearchFilter fields use index scans instead
+            # of seq scans (requires the pg_trgm extension)
+            GinIndex(
+                name='rawfeed_text_trgm',
+                fields=['text'],
+                opclasses=['gin_trgm_ops']
+            ),
+            GinIndex(
+                name='rawfeed_product_trgm',
+                fields=['product_name'],
+                opclasses=['gin_trgm_ops']
+            ),
+            GinIndex(
+                name='rawfeed_customer_trgm',
+                fields=['customer_name'],
+                opclasses=['gin_trgm_ops']
+            ),
+            GinIndex(
+                name='rawfeed_email_trgm',
+                fields=['customer_email'],
+                opclasses=['gin_trgm_ops']
+            ),
         ]
         verbose_name = "Raw Feedback"
         verbose_name_plural = "Raw Feedbacks"
@@ -178,6 +215,34 @@ class RawFeed(models.Model):
         return self.status == 'failed'
 
 
+class FeedbackDaily(models.Model):
+    """
+    Read-only mapping of the mv_feedback_daily materialized view.
+
+    Pre-aggregated per (entity, day, status, source) by the
+    refresh_feedback_daily_mv Celery task so dashboards can aggregate a
+    roll-up instead of scanning raw feedbacks.
+    """
+
+    # Synthetic key from row_number(): entity_id repeats across
+    # day/status/source rows, so it can't be the pk
+    row_id = models.BigIntegerField(primary_key=True)
+    entity_id = models.BigIntegerField()
+    day = models.DateTimeField()
+    status = models.CharField(max_length=20)
+    source = models.CharField(max_length=50)
+    feedback_count = models.BigIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'mv_feedback_daily'
+        verbose_name = "Feedback Daily Rollup"
+        verbose_name_plural = "Feedback Daily Rollups"
+
+    def __str__(self):
+        return f"Entity #{self.entity_id} - {self.day:%Y-%m-%d} - {self.status}/{self.source}"
+
+
 class FeedbackBatch(models.Model):
     """
     Track bulk upload batches for better organization.
@@ -1,15 +1,35 @@
 from rest_framework import serializers
 from django.core.validators import FileExtensionValidator
+from django.db import IntegrityError
 from .models import BusinessEntity, RawFeed, FeedbackBatch
 
+_MIN_TEXT_LENGTH = 5
+
+# Built once at import; display lookups in list rendering are then a
+# plain dict get instead of a model method call per instance
+_STATUS_DISPLAY = dict(RawFeed.STATUS_CHOICES)
+_SOURCE_DISPLAY = dict(RawFeed.SOURCE_CHOICES)
+
+
+def _validate_feedback_text(value):
+    """Shared text validator: strip and enforce minimum length."""
+    stripped = (value or '').strip()
+    if len(stripped) < _MIN_TEXT_LENGTH:
+        raise serializers.ValidationError(
+            "Feedback text must be at least 5 characters long."
+        )
+    return stripped
+
 
 class BusinessEntitySerializer(serializers.ModelSerializer):
     """Serializer for Business Entity"""
     
     owner_username = serializers.CharField(source='owner.username', read_only=True)
-    total_feedbacks = serializers.IntegerField(read_only=True)
-    new_feedbacks = serializers.IntegerField(read_only=True)
-    processed_feedbacks = serializers.IntegerField(read_only=True)
+    # Filled by queryset annotations; default covers freshly created
+    # instances that never went through the annotated queryset
+    total_feedbacks = serializers.IntegerField(read_only=True, default=0)
+    new_feedbacks = serializers.IntegerField(read_only=True, default=0)
+    processed_feedbacks = serializers.IntegerField(read_only=True, default=0)
     
     class Meta:
         model = BusinessEntity
@@ -21,45 +41,59 @@ class BusinessEntitySerializer(serializers.ModelSerializer):
         read_only_fields = ['owner', 'created_at', 'updated_at']
     
     def validate_name(self, value):
-        """Ensure name is not empty and unique"""
+        """Normalize name; uniqueness is enforced by the DB constraint"""
         if not value or not value.strip():
             raise serializers.ValidationError("Name cannot be empty.")
-        
-        # Check uniqueness (excluding current instance during update)
-        queryset = BusinessEntity.objects.filter(name__iexact=value)
-        if self.instance:
-            queryset = queryset.exclude(pk=self.instance.pk)
-        
-        if queryset.exists():
-            raise serializers.ValidationError("Business entity with this name already exists.")
-        
         return value.strip()
 
+    def create(self, validated_data):
+        try:
+            return super().create(validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError({
+                'name': 'Business entity with this name already exists.'
+            })
+
+    def update(self, instance, validated_data):
+        try:
+            return super().update(instance, validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError({
+                'name': 'Business entity with this name already exists.'
+            })
+
 
 class BusinessEntityListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for list views"""
-    
+    """
+    Lightweight serializer for list views.
+
+    Expects the queryset to be annotated with
+    feedback_count=Count('raw_feeds'); falls back to a per-row COUNT
+    only if the annotation is missing.
+    """
+
     owner_username = serializers.CharField(source='owner.username', read_only=True)
     feedback_count = serializers.SerializerMethodField()
-    
+
     class Meta:
         model = BusinessEntity
         fields = [
-            'id', 'name', 'owner_username', 
+            'id', 'name', 'owner_username',
             'is_active', 'feedback_count', 'created_at'
         ]
-    
+
     def get_feedback_count(self, obj):
-        return obj.raw_feeds.count()
+        count = getattr(obj, 'feedback_count', None)
+        return count if count is not None else obj.raw_feeds.count()
 
 
 class RawFeedSerializer(serializers.ModelSerializer):
     """Serializer for Raw Feedback"""
     
     entity_name = serializers.CharField(source='entity.name', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
-    source_display = serializers.CharField(source='get_source_display', read_only=True)
-    
+    status_display = serializers.SerializerMethodField()
+    source_display = serializers.SerializerMethodField()
+
     class Meta:
         model = RawFeed
         fields = [
@@ -72,14 +106,16 @@ class RawFeedSerializer(serializers.ModelSerializer):
             'status', 'error_message', 'created_at', 'processed_at'
         ]
     
+    def get_status_display(self, obj):
+        return _STATUS_DISPLAY.get(obj.status, obj.status)
+
+    def get_source_display(self, obj):
+        return _SOURCE_DISPLAY.get(obj.source, obj.source)
+
     def validate_text(self, value):
         """Ensure feedback text is not empty and has minimum length"""
-        if not value or len(value.strip()) < 5:
-            raise serializers.ValidationError(
-                "Feedback text must be at least 5 characters long."
-            )
-        return value.strip()
-    
+        return _validate_feedback_text(value)
+
     def validate_rating(self, value):
         """Validate rating is between 1 and 5"""
         if value is not None and (value < 1 or value > 5):
@@ -102,7 +138,7 @@ class RawFeedListSerializer(serializers.ModelSerializer):
     
     entity_name = serializers.CharField(source='entity.name', read_only=True)
     text_preview = serializers.SerializerMethodField()
-    source_display = serializers.CharField(source='get_source_display', read_only=True)
+    source_display = serializers.SerializerMethodField()
     
     class Meta:
         model = RawFeed
@@ -113,7 +149,15 @@ class RawFeedListSerializer(serializers.ModelSerializer):
     
     def get_text_preview(self, obj):
         """Return first 80 characters of text"""
-        return obj.text[:80] + '...' if len(obj.text) > 80 else obj.text
+        # Prefer the DB-sliced annotation (81 chars: one extra to tell
+        # whether an ellipsis is needed without fetching the full text)
+        text = getattr(obj, 'text_preview', None)
+        if text is None:
+            text = obj.text
+        return text[:80] + '...' if len(text) > 80 else text
+
+    def get_source_display(self, obj):
+        return _SOURCE_DISPLAY.get(obj.source, obj.source)
 
 
 class RawFeedCreateSerializer(serializers.ModelSerializer):
@@ -128,11 +172,7 @@ class RawFeedCreateSerializer(serializers.ModelSerializer):
         ]
     
     def validate_text(self, value):
-        if not value or len(value.strip()) < 5:
-            raise serializers.ValidationError(
-                "Feedback text must be at least 5 characters long."
-            )
-        return value.strip()
+        return _validate_feedback_text(value)
 
 
 class BulkFeedbackSerializer(serializers.Serializer):
@@ -175,24 +215,35 @@ class BulkFeedbackSerializer(serializers.Serializer):
     )
     
     def validate_entity_id(self, value):
-        """Ensure entity exists and is active"""
-        try:
-            entity = BusinessEntity.objects.get(id=value)
+        """
+        Ensure entity exists and is active.
+
+        Callers validating many rows for one entity should put the
+        fetched entity in the serializer context to skip the per-row
+        query entirely.
+        """
+        entity = self.context.get('entity')
+        if entity is not None and entity.id == value:
             if not entity.is_active:
                 raise serializers.ValidationError("Entity is not active.")
             return value
-        except BusinessEntity.DoesNotExist:
+
+        # Single indexed lookup fetching only the flag we need
+        is_active = BusinessEntity.objects.filter(
+            id=value
+        ).values_list('is_active', flat=True).first()
+
+        if is_active is None:
             raise serializers.ValidationError(
                 f"BusinessEntity with id {value} does not exist."
             )
-    
+        if not is_active:
+            raise serializers.ValidationError("Entity is not active.")
+        return value
+
     def validate_text(self, value):
         """Ensure text is not empty"""
-        if not value or len(value.strip()) < 5:
-            raise serializers.ValidationError(
-                "Text must be at least 5 characters long."
-            )
-        return value.strip()
+        return _validate_feedback_text(value)
 
 
 class FileUploadSerializer(serializers.Serializer):
@@ -222,16 +273,18 @@ class FileUploadSerializer(serializers.Serializer):
         return value
     
     def validate_entity_id(self, value):
-        """Ensure entity exists and is active"""
-        try:
-            entity = BusinessEntity.objects.get(id=value)
-            if not entity.is_active:
-                raise serializers.ValidationError("Cannot upload to inactive entity.")
-            return value
-        except BusinessEntity.DoesNotExist:
+        """Ensure entity exists and is active (one indexed lookup)"""
+        is_active = BusinessEntity.objects.filter(
+            id=value
+        ).values_list('is_active', flat=True).first()
+
+        if is_active is None:
             raise serializers.ValidationError(
                 f"BusinessEntity with id {value} does not exist."
             )
+        if not is_active:
+            raise serializers.ValidationError("Cannot upload to inactive entity.")
+        return value
 
 
 class FeedbackBatchSerializer(serializers.ModelSerializer):
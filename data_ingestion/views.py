@@ -3,7 +3,13 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
-from django.db.models import Count, Avg, Q
+from rest_framework.pagination import PageNumberPagination
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from django.core.files.storage import default_storage
+from django.db.models import Count, Avg, F, Q
+from django.db.models.functions import Substr, TruncDate
 from django.utils import timezone
 from datetime import timedelta
 from .models import BusinessEntity, RawFeed, FeedbackBatch
@@ -12,10 +18,8 @@ from .serializer import (
     RawFeedSerializer, RawFeedListSerializer, RawFeedCreateSerializer,
     FileUploadSerializer, FeedbackBatchSerializer, FeedbackStatsSerializer
 )
-import csv
-import io
-import pandas as pd
-import json
+from .tasks import ingest_upload
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -45,12 +49,31 @@ class BusinessEntityViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         user = self.request.user
-        
+
+        # owner_username comes from the same query instead of a lazy
+        # SELECT per entity
+        base = BusinessEntity.objects.select_related('owner')
+
         # Admins can see all entities, others only their own
         if user.is_admin:
-            queryset = BusinessEntity.objects.all()
+            queryset = base.all()
+        else:
+            queryset = base.filter(owner=user)
+
+        # Counted in the same query; the serializers read these instead
+        # of issuing a COUNT per entity (N+1)
+        if self.action == 'list':
+            queryset = queryset.annotate(feedback_count=Count('raw_feeds'))
         else:
-            queryset = BusinessEntity.objects.filter(owner=user)
+            queryset = queryset.annotate(
+                total_feedbacks=Count('raw_feeds'),
+                new_feedbacks=Count(
+                    'raw_feeds', filter=Q(raw_feeds__status='new')
+                ),
+                processed_feedbacks=Count(
+                    'raw_feeds', filter=Q(raw_feeds__status='processed')
+                ),
+            )
         
         # Filter by active status
         is_active = self.request.query_params.get('is_active')
@@ -69,18 +92,34 @@ class BusinessEntityViewSet(viewsets.ModelViewSet):
     def statistics(self, request, pk=None):
         """Get detailed statistics for an entity"""
         entity = self.get_object()
-        
+
+        # Dashboards poll this; a 2-minute-stale answer straight from
+        # Redis beats recomputing the aggregates per page load
+        cache_key = f"entitystats:{entity.pk}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
         feedbacks = entity.raw_feeds.all()
-        
+
+        # One aggregate pass for the counts and average instead of a
+        # COUNT query per status
+        agg = feedbacks.aggregate(
+            total=Count('id'),
+            new=Count('id', filter=Q(status='new')),
+            processing=Count('id', filter=Q(status='processing')),
+            processed=Count('id', filter=Q(status='processed')),
+            failed=Count('id', filter=Q(status='failed')),
+            avg_rating=Avg('rating'),
+        )
+
         stats = {
-            'total_feedbacks': feedbacks.count(),
-            'new_feedbacks': feedbacks.filter(status='new').count(),
-            'processing_feedbacks': feedbacks.filter(status='processing').count(),
-            'processed_feedbacks': feedbacks.filter(status='processed').count(),
-            'failed_feedbacks': feedbacks.filter(status='failed').count(),
-            'average_rating': feedbacks.aggregate(
-                avg_rating=Avg('rating')
-            )['avg_rating'] or 0,
+            'total_feedbacks': agg['total'],
+            'new_feedbacks': agg['new'],
+            'processing_feedbacks': agg['processing'],
+            'processed_feedbacks': agg['processed'],
+            'failed_feedbacks': agg['failed'],
+            'average_rating': agg['avg_rating'] or 0,
             'sources_breakdown': dict(
                 feedbacks.values('source').annotate(
                     count=Count('id')
@@ -95,24 +134,61 @@ class BusinessEntityViewSet(viewsets.ModelViewSet):
             ),
             'daily_trend': self._get_daily_trend(feedbacks)
         }
-        
+
         serializer = FeedbackStatsSerializer(stats)
+        cache.set(cache_key, serializer.data, timeout=120)
         return Response(serializer.data)
-    
+
     def _get_daily_trend(self, queryset):
-        """Get feedback count for last 7 days"""
+        """Get feedback count for last 7 days (one GROUP BY query)"""
         today = timezone.now().date()
-        trend = []
-        
-        for i in range(6, -1, -1):
-            date = today - timedelta(days=i)
-            count = queryset.filter(created_at__date=date).count()
-            trend.append({
-                'date': date.isoformat(),
-                'count': count
-            })
-        
-        return trend
+        start = today - timedelta(days=6)
+
+        rows = dict(
+            queryset.filter(created_at__date__gte=start)
+            .annotate(day=TruncDate('created_at'))
+            .values('day').annotate(count=Count('id'))
+            .values_list('day', 'count')
+        )
+
+        return [
+            {
+                'date': (start + timedelta(days=i)).isoformat(),
+                'count': rows.get(start + timedelta(days=i), 0),
+            }
+            for i in range(7)
+        ]
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches COUNT(*) for 30 seconds.
+
+    DRF runs the count on every list request; on a large RawFeed table
+    that's the most expensive part of the page. The cache key hashes the
+    compiled SQL, so each distinct filter combination gets its own entry.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+
+        key = 'cnt:%s' % hashlib.sha1(str(query).encode()).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(key, count, timeout=30)
+        return count
+
+
+class RawFeedPagination(PageNumberPagination):
+    """Bound list responses - an entity can hold 100k+ feedbacks"""
+    django_paginator_class = CachedCountPaginator
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 500
 
 
 class RawFeedViewSet(viewsets.ModelViewSet):
@@ -127,6 +203,7 @@ class RawFeedViewSet(viewsets.ModelViewSet):
     destroy: DELETE /api/data-ingestion/feedbacks/{id}/
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = RawFeedPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['text', 'product_name', 'customer_name', 'customer_email']
     ordering_fields = ['created_at', 'rating', 'status', 'processed_at']
@@ -144,17 +221,64 @@ class RawFeedViewSet(viewsets.ModelViewSet):
         
         # Base queryset - users can only see feedbacks from their entities
         if user.is_admin:
-            queryset = RawFeed.objects.select_related('entity').all()
+            queryset = RawFeed.objects.select_related(
+                'entity', 'entity__owner'
+            ).all()
         else:
-            queryset = RawFeed.objects.select_related('entity').filter(
-                entity__owner=user
+            queryset = RawFeed.objects.select_related(
+                'entity', 'entity__owner'
+            ).filter(entity__owner=user)
+
+        # The list serializer only shows an 80-char preview; have the
+        # DB slice it and fetch only the columns the serializer renders
+        if self.action == 'list':
+            queryset = queryset.annotate(
+                text_preview=Substr('text', 1, 81)
+            ).only(
+                'id', 'source', 'product_name', 'rating', 'status',
+                'created_at', 'entity__name'
             )
-        
+
         # Apply filters
         queryset = self._apply_filters(queryset)
-        
+
         return queryset
     
+    # Display labels resolved in Python; same dict the serializers use
+    _SOURCE_DISPLAY = dict(RawFeed.SOURCE_CHOICES)
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serve the listing straight from .values().
+
+        Skips model instantiation and DRF's per-field serializer
+        machinery - the dominant CPU cost when rendering hundreds of
+        rows - while returning the same shape as RawFeedListSerializer.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+
+        rows = queryset.values(
+            'id', 'source', 'product_name', 'rating', 'status',
+            'created_at', 'text_preview',
+            entity_name=F('entity__name'),
+        )
+
+        page = self.paginate_queryset(rows)
+        data = page if page is not None else list(rows)
+
+        for row in data:
+            preview = row['text_preview'] or ''
+            row['text_preview'] = (
+                preview[:80] + '...' if len(preview) > 80 else preview
+            )
+            row['source_display'] = self._SOURCE_DISPLAY.get(
+                row['source'], row['source']
+            )
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
     def _apply_filters(self, queryset):
         """Apply query parameter filters"""
         
@@ -202,7 +326,8 @@ class RawFeedViewSet(viewsets.ModelViewSet):
         """Create feedback"""
         # Verify user owns the entity
         entity = serializer.validated_data['entity']
-        if not self.request.user.is_admin and entity.owner != self.request.user:
+        # Compare ids so we don't lazily fetch the owner row
+        if not self.request.user.is_admin and entity.owner_id != self.request.user.id:
             from rest_framework.exceptions import PermissionDenied
             raise PermissionDenied("You don't have permission to add feedback to this entity.")
         
@@ -259,169 +384,47 @@ class BulkFeedbackUploadView(APIView):
         entity_id = serializer.validated_data['entity_id']
         source = serializer.validated_data['source']
         
-        # Verify user owns the entity
-        try:
-            entity = BusinessEntity.objects.get(id=entity_id)
-            if not request.user.is_admin and entity.owner != request.user:
-                return Response(
-                    {'error': "You don't have permission to upload to this entity"},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-        except BusinessEntity.DoesNotExist:
+        # Fetch and permission-check in one query: non-admins only get
+        # the entity back if they own it
+        entity_qs = BusinessEntity.objects.filter(id=entity_id)
+        if not request.user.is_admin:
+            entity_qs = entity_qs.filter(owner=request.user)
+        entity = entity_qs.first()
+        if entity is None:
             return Response(
                 {'error': 'Business entity not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
         # Create batch record
+        file_type = file.name.split('.')[-1].lower()
         batch = FeedbackBatch.objects.create(
             entity=entity,
             uploaded_by=request.user,
             file_name=file.name,
-            file_type=file.name.split('.')[-1].lower(),
+            file_type=file_type,
             source=source,
             status='processing'
         )
-        
-        try:
-            # Process based on file type
-            if file.name.endswith('.csv'):
-                result = self._process_csv(file, entity, source, batch)
-            elif file.name.endswith(('.xls', '.xlsx')):
-                result = self._process_excel(file, entity, source, batch)
-            elif file.name.endswith('.json'):
-                result = self._process_json(file, entity, source, batch)
-            else:
-                batch.status = 'failed'
-                batch.save()
-                return Response(
-                    {'error': 'Unsupported file format'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Update batch status
-            batch.status = 'completed'
-            batch.completed_at = timezone.now()
-            batch.save()
-            
-            logger.info(
-                f"Batch upload completed: {result['created_count']} created, "
-                f"{result['skipped_count']} skipped by {request.user.username}"
-            )
-            
-            return Response({
-                'batch_id': batch.id,
-                **result
-            }, status=status.HTTP_201_CREATED)
-            
-        except Exception as e:
-            batch.status = 'failed'
-            batch.error_log.append({'error': str(e)})
-            batch.save()
-            
-            logger.error(f"Batch upload failed: {str(e)}")
-            
-            return Response(
-                {'error': f'Upload failed: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-    
-    def _process_csv(self, file, entity, source, batch):
-        """Process CSV file"""
-        decoded_file = file.read().decode('utf-8')
-        io_string = io.StringIO(decoded_file)
-        reader = csv.DictReader(io_string)
-        
-        return self._create_feedbacks_from_rows(reader, entity, source, batch)
-    
-    def _process_excel(self, file, entity, source, batch):
-        """Process Excel file"""
-        df = pd.read_excel(file)
-        # Replace NaN with None
-        df = df.where(pd.notna(df), None)
-        rows = df.to_dict('records')
-        
-        return self._create_feedbacks_from_rows(rows, entity, source, batch)
-    
-    def _process_json(self, file, entity, source, batch):
-        """Process JSON file"""
-        data = json.load(file)
-        
-        if not isinstance(data, list):
-            raise ValueError("JSON must be an array of feedback objects")
-        
-        return self._create_feedbacks_from_rows(data, entity, source, batch)
-    
-    def _create_feedbacks_from_rows(self, rows, entity, source, batch):
-        """Create RawFeed objects from rows"""
-        created_feedbacks = []
-        skipped_rows = []
-        
-        for index, row in enumerate(rows, start=1):
-            # Map common column names (flexible)
-            text = (
-                row.get('text') or 
-                row.get('feedback_text') or 
-                row.get('feedback') or
-                row.get('comment') or
-                row.get('review')
-            )
-            
-            if not text or len(str(text).strip()) < 5:
-                error = {
-                    'row': index,
-                    'reason': 'Text missing or too short'
-                }
-                skipped_rows.append(error)
-                batch.error_log.append(error)
-                continue
-            
-            try:
-                # Extract rating
-                rating_value = row.get('rating')
-                if rating_value:
-                    try:
-                        rating_value = int(float(rating_value))
-                        if rating_value < 1 or rating_value > 5:
-                            rating_value = None
-                    except (ValueError, TypeError):
-                        rating_value = None
-                
-                feedback = RawFeed.objects.create(
-                    entity=entity,
-                    text=str(text).strip(),
-                    source=row.get('source', source),
-                    product_name=row.get('product_name'),
-                    customer_name=row.get('customer_name'),
-                    customer_email=row.get('customer_email'),
-                    rating=rating_value,
-                    external_id=row.get('external_id') or row.get('id'),
-                    status='new'
-                )
-                created_feedbacks.append(feedback)
-                
-            except Exception as e:
-                error = {
-                    'row': index,
-                    'reason': str(e)
-                }
-                skipped_rows.append(error)
-                batch.error_log.append(error)
-        
-        # Update batch statistics
-        batch.total_rows = index
-        batch.successful_rows = len(created_feedbacks)
-        batch.failed_rows = len(skipped_rows)
-        batch.save()
-        
-        return {
-            'message': 'Bulk upload completed',
-            'created_count': len(created_feedbacks),
-            'skipped_count': len(skipped_rows),
-            'created_ids': [f.id for f in created_feedbacks],
-            'skipped_rows': skipped_rows[:20],  # Return first 20 errors
-            'total_errors': len(skipped_rows)
-        }
+
+        # Persist the upload and hand parsing to a worker so the
+        # request thread isn't held for the whole parse; clients poll
+        # the batch endpoint for progress
+        file_key = default_storage.save(
+            f'uploads/{batch.id}/{file.name}', file
+        )
+        ingest_upload.delay(file_key, batch.id)
+
+        logger.info(
+            f"Batch upload accepted: #{batch.id} ({file.name}) "
+            f"by {request.user.username}"
+        )
+
+        return Response({
+            'batch_id': batch.id,
+            'message': 'Upload accepted; parsing in background',
+            'status_url': f'/api/data-ingestion/batches/{batch.id}/'
+        }, status=status.HTTP_202_ACCEPTED)
 
 
 class FeedbackStatsView(APIView):
@@ -437,7 +440,16 @@ class FeedbackStatsView(APIView):
     def get(self, request):
         user = request.user
         entity_id = request.query_params.get('entity_id')
-        
+
+        # Same short-TTL cache as the per-entity statistics action
+        cache_key = (
+            f"fbstats:{user.id}:{entity_id or 'all'}:{int(user.is_admin)}"
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
+
         # Get feedbacks based on user permissions
         if user.is_admin:
             queryset = RawFeed.objects.all()
@@ -447,15 +459,24 @@ class FeedbackStatsView(APIView):
         if entity_id:
             queryset = queryset.filter(entity_id=entity_id)
         
+        # All counts and the average in one pass instead of a COUNT
+        # query per status
+        agg = queryset.aggregate(
+            total=Count('id'),
+            new=Count('id', filter=Q(status='new')),
+            processing=Count('id', filter=Q(status='processing')),
+            processed=Count('id', filter=Q(status='processed')),
+            failed=Count('id', filter=Q(status='failed')),
+            avg_rating=Avg('rating'),
+        )
+
         stats = {
-            'total_feedbacks': queryset.count(),
-            'new_feedbacks': queryset.filter(status='new').count(),
-            'processing_feedbacks': queryset.filter(status='processing').count(),
-            'processed_feedbacks': queryset.filter(status='processed').count(),
-            'failed_feedbacks': queryset.filter(status='failed').count(),
-            'average_rating': queryset.aggregate(
-                avg_rating=Avg('rating')
-            )['avg_rating'] or 0,
+            'total_feedbacks': agg['total'],
+            'new_feedbacks': agg['new'],
+            'processing_feedbacks': agg['processing'],
+            'processed_feedbacks': agg['processed'],
+            'failed_feedbacks': agg['failed'],
+            'average_rating': agg['avg_rating'] or 0,
             'sources_breakdown': dict(
                 queryset.values('source').annotate(
                     count=Count('id')
@@ -470,24 +491,30 @@ class FeedbackStatsView(APIView):
             ),
             'daily_trend': self._get_daily_trend(queryset)
         }
-        
+
         serializer = FeedbackStatsSerializer(stats)
+        cache.set(cache_key, serializer.data, timeout=120)
         return Response(serializer.data)
     
     def _get_daily_trend(self, queryset):
-        """Get feedback count for last 7 days"""
+        """Get feedback count for last 7 days (one GROUP BY query)"""
         today = timezone.now().date()
-        trend = []
-        
-        for i in range(6, -1, -1):
-            date = today - timedelta(days=i)
-            count = queryset.filter(created_at__date=date).count()
-            trend.append({
-                'date': date.isoformat(),
-                'count': count
-            })
-        
-        return trend
+        start = today - timedelta(days=6)
+
+        rows = dict(
+            queryset.filter(created_at__date__gte=start)
+            .annotate(day=TruncDate('created_at'))
+            .values('day').annotate(count=Count('id'))
+            .values_list('day', 'count')
+        )
+
+        return [
+            {
+                'date': (start + timedelta(days=i)).isoformat(),
+                'count': rows.get(start + timedelta(days=i), 0),
+            }
+            for i in range(7)
+        ]
 
 
 class FeedbackBatchViewSet(viewsets.ReadOnlyModelViewSet):
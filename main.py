@@ -1 +0,0 @@
-print("hello world")
\ No newline at end of file
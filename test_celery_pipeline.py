@@ -18,9 +18,11 @@ django.setup()
 
 from data_ingestion.models import RawFeed, BusinessEntity
 from analysis.models import ProcessedFeedback
+from celery import group
+from django.db import transaction
+from django.db.models import Avg, Count
 from data_ingestion.tasks import (
-    test_celery, add_numbers, process_feedback,
-    process_bulk_feedbacks
+    test_celery, add_numbers, process_feedback_with_ai
 )
 from django.contrib.auth import get_user_model
 
@@ -35,11 +37,31 @@ END = '\033[0m'
 
 
 def log(message, color=None):
-    """Print colored log message"""
+    """Write a colored log line to stdout's buffer (no per-line flush)"""
     if color:
-        print(f"{color}{message}{END}")
+        sys.stdout.write(f"{color}{message}{END}\n")
     else:
-        print(message)
+        sys.stdout.write(f"{message}\n")
+
+
+def emit_metrics(results):
+    """Send pass/fail counters in one statsd pipeline (one UDP batch)"""
+    host = os.getenv('STATSD_HOST')
+    if not host:
+        return
+    try:
+        import statsd
+    except ImportError:
+        log("⚠️  STATSD_HOST set but the statsd package is not installed", YELLOW)
+        return
+    try:
+        client = statsd.StatsClient(host, int(os.getenv('STATSD_PORT', '8125')))
+        with client.pipeline() as pipe:
+            for test_name, passed in results.items():
+                outcome = 'pass' if passed else 'fail'
+                pipe.incr(f'celery_test.{test_name}.{outcome}')
+    except Exception as e:
+        log(f"⚠️  Could not emit statsd metrics: {str(e)}", YELLOW)
 
 
 def test_celery_basics():
@@ -48,23 +70,29 @@ def test_celery_basics():
     log("🧪 Testing Basic Celery Functionality", BLUE)
     print("="*60)
     
+    # Submit both probes up front so they run concurrently on the
+    # worker; total wait is max(task time), not the sum
+    try:
+        simple_result = test_celery.delay()
+        math_result = add_numbers.delay(15, 25)
+    except Exception as e:
+        log(f"   ❌ Failed to queue tasks: {str(e)}", RED)
+        return False
+
     # Test 1: Simple test task
     log("\n1️⃣ Testing simple task...", YELLOW)
     try:
-        result = test_celery.delay()
-        log(f"   Task ID: {result.id}", GREEN)
-        
-        response = result.get(timeout=10)
+        log(f"   Task ID: {simple_result.id}", GREEN)
+        response = simple_result.get(timeout=10, interval=0.05)
         log(f"   ✅ Result: {response}", GREEN)
     except Exception as e:
         log(f"   ❌ Failed: {str(e)}", RED)
         return False
-    
+
     # Test 2: Math task
     log("\n2️⃣ Testing math task...", YELLOW)
     try:
-        result = add_numbers.delay(15, 25)
-        response = result.get(timeout=10)
+        response = math_result.get(timeout=10, interval=0.05)
         log(f"   ✅ 15 + 25 = {response}", GREEN)
     except Exception as e:
         log(f"   ❌ Failed: {str(e)}", RED)
@@ -130,7 +158,7 @@ def test_single_feedback_processing(entity):
     # Process the feedback
     log("\n2️⃣ Queuing for processing...", YELLOW)
     try:
-        result = process_feedback.delay(feedback.id)
+        result = process_feedback_with_ai.delay(feedback.id)
         log(f"   Task ID: {result.id}", GREEN)
         
         # FIXED: Wait longer since task has 2-second sleep + processing
@@ -145,7 +173,7 @@ def test_single_feedback_processing(entity):
             try:
                 # Check if task is ready (non-blocking)
                 if result.ready():
-                    response = result.get(timeout=1)
+                    response = result.get(timeout=1, interval=0.05)
                     task_completed = True
                     break
             except Exception:
@@ -158,7 +186,7 @@ def test_single_feedback_processing(entity):
                 task_completed = True
                 # Try to get result one more time
                 try:
-                    response = result.get(timeout=5)
+                    response = result.get(timeout=5, interval=0.05)
                 except:
                     # Manually construct response from DB
                     response = {
@@ -225,77 +253,70 @@ def test_bulk_processing(entity):
         {"text": "Delivery was slow but product is good.", "rating": 4},
     ]
     
-    feedback_ids = []
-    for i, fb_data in enumerate(test_feedbacks, 1):
-        feedback = RawFeed.objects.create(
-            entity=entity,
-            text=fb_data['text'],
-            source='test',
-            rating=fb_data['rating']
-        )
-        feedback_ids.append(feedback.id)
-        log(f"   Created feedback #{feedback.id}: {fb_data['text'][:50]}", GREEN)
+    # One INSERT for the whole set instead of a round-trip per row;
+    # bulk_create returns the assigned pks on Postgres. The atomic
+    # block commits before any task is dispatched below, so a worker
+    # can never pick up an id whose row isn't visible yet.
+    with transaction.atomic():
+        created = RawFeed.objects.bulk_create([
+            RawFeed(
+                entity=entity,
+                text=fb_data['text'],
+                source='test',
+                rating=fb_data['rating']
+            )
+            for fb_data in test_feedbacks
+        ], batch_size=500)
+    feedback_ids = [feedback.id for feedback in created]
+    for feedback in created:
+        log(f"   Created feedback #{feedback.id}: {feedback.text[:50]}", GREEN)
     
-    # Process in bulk
+    # Process in bulk as a group: join() returns as soon as the last
+    # task finishes instead of burning a fixed sleep budget, and a
+    # stuck task surfaces as a timeout rather than a silent poll loop
     log(f"\n2️⃣ Queuing {len(feedback_ids)} feedbacks for processing...", YELLOW)
     try:
-        result = process_bulk_feedbacks.delay(feedback_ids)
-        log(f"   Bulk task ID: {result.id}", GREEN)
-        
-        log("\n3️⃣ Waiting for bulk task to queue individual tasks...", YELLOW)
-        response = result.get(timeout=30)
-        
-        log(f"\n   ✅ Bulk queuing completed!", GREEN)
-        log(f"   Total: {response['total']}", GREEN)
-        log(f"   Queued: {response['queued']}", GREEN)
-        log(f"   Failed: {response['failed']}", GREEN)
-        
-        # Wait for individual tasks to complete
-        log("\n4️⃣ Waiting for individual tasks to complete (each has 2s sleep)...", YELLOW)
-        log("   This will take ~15-20 seconds...", YELLOW)
-        
-        max_wait = 60  # Max 60 seconds
+        job = group(
+            process_feedback_with_ai.s(fb_id) for fb_id in feedback_ids
+        ).apply_async()
+        log(f"   Group ID: {job.id}", GREEN)
+
+        log("\n3️⃣ Waiting for the group to complete...", YELLOW)
         start_time = time.time()
-        
-        processed_count = 0
-        while (time.time() - start_time) < max_wait:
-            processed_count = RawFeed.objects.filter(
-                id__in=feedback_ids,
-                status='processed'
-            ).count()
-            
-            elapsed = int(time.time() - start_time)
-            
-            if processed_count == len(feedback_ids):
-                log(f"   ✅ All feedbacks processed in {elapsed}s!", GREEN)
-                break
-            
-            if elapsed % 5 == 0 and elapsed > 0:
-                log(f"   ⏱️  Processed: {processed_count}/{len(feedback_ids)} ({elapsed}s)", YELLOW)
-            
-            time.sleep(1)
-        
-        # Check results
-        log("\n5️⃣ Verifying results...", YELLOW)
+        responses = job.join(timeout=60, interval=0.05, propagate=False)
+        elapsed = time.time() - start_time
+
+        succeeded = sum(
+            1 for response in responses
+            if isinstance(response, dict) and response.get('status') == 'success'
+        )
+        log(f"   ✅ {succeeded}/{len(feedback_ids)} tasks succeeded in {elapsed:.1f}s", GREEN)
+
+        # Check results - one query with the reverse one-to-one joined
+        # in, instead of a get() plus a lazy lookup per id
+        log("\n4️⃣ Verifying results...", YELLOW)
         final_processed = 0
-        for fb_id in feedback_ids:
-            try:
-                feedback = RawFeed.objects.get(id=fb_id)
-                if feedback.status == 'processed':
-                    final_processed += 1
-                    if hasattr(feedback, 'processed_feedback'):
-                        pf = feedback.processed_feedback
-                        log(
-                            f"   ✅ #{fb_id}: {pf.sentiment} "
-                            f"({pf.sentiment_score:.2f})",
-                            GREEN
-                        )
-                    else:
-                        log(f"   ⚠️ #{fb_id}: Processed but no ProcessedFeedback", YELLOW)
+        feedbacks = RawFeed.objects.filter(
+            id__in=feedback_ids
+        ).select_related('processed_feedback').only(
+            'id', 'status',
+            'processed_feedback__sentiment',
+            'processed_feedback__sentiment_score'
+        )
+        for feedback in feedbacks:
+            if feedback.status == 'processed':
+                final_processed += 1
+                pf = getattr(feedback, 'processed_feedback', None)
+                if pf is not None:
+                    log(
+                        f"   ✅ #{feedback.id}: {pf.sentiment} "
+                        f"({pf.sentiment_score:.2f})",
+                        GREEN
+                    )
                 else:
-                    log(f"   ⏱️  #{fb_id}: Status = {feedback.status}", YELLOW)
-            except Exception as e:
-                log(f"   ❌ #{fb_id}: {str(e)}", RED)
+                    log(f"   ⚠️ #{feedback.id}: Processed but no ProcessedFeedback", YELLOW)
+            else:
+                log(f"   ⏱️  #{feedback.id}: Status = {feedback.status}", YELLOW)
         
         log(f"\n   Final: {final_processed}/{len(feedback_ids)} processed", 
             GREEN if final_processed > 0 else YELLOW)
@@ -316,34 +337,32 @@ def test_statistics():
     print("="*60)
     
     try:
-        total_processed = ProcessedFeedback.objects.count()
+        # Total and average in one aggregate, then one GROUP BY for the
+        # breakdown - two queries instead of three
+        totals = ProcessedFeedback.objects.aggregate(
+            total=Count('id'),
+            avg=Avg('sentiment_score')
+        )
+        total_processed = totals['total']
         log(f"\nTotal processed feedbacks: {total_processed}", GREEN)
-        
+
         if total_processed == 0:
             log("   ℹ️  No processed feedbacks yet", YELLOW)
             return True
-        
-        # Count by sentiment
-        from django.db.models import Count
-        
+
         sentiment_counts = ProcessedFeedback.objects.values('sentiment').annotate(
             count=Count('id')
         )
-        
+
         log("\nSentiment breakdown:", YELLOW)
         for item in sentiment_counts:
             sentiment = item['sentiment']
             count = item['count']
             percentage = (count / total_processed * 100)
             log(f"   {sentiment.capitalize()}: {count} ({percentage:.1f}%)", GREEN)
-        
-        # Average score
-        from django.db.models import Avg
-        avg_score = ProcessedFeedback.objects.aggregate(
-            avg=Avg('sentiment_score')
-        )['avg']
-        log(f"\nAverage sentiment score: {avg_score:.2f}", GREEN)
-        
+
+        log(f"\nAverage sentiment score: {totals['avg']:.2f}", GREEN)
+
         return True
         
     except Exception as e:
@@ -400,6 +419,7 @@ def main():
     
     # Test 1: Basic Celery
     results['basic'] = test_celery_basics()
+    sys.stdout.flush()
     
     if not results['basic']:
         log("\n❌ Basic Celery tests failed. Fix Celery setup first!", RED)
@@ -420,7 +440,11 @@ def main():
     
     # Test 5: Periodic tasks
     results['periodic'] = test_periodic_tasks()
-    
+    sys.stdout.flush()
+
+    # Optional: one batched metric emission for CI dashboards
+    emit_metrics(results)
+
     # Summary
     print("\n" + "="*60)
     log("📋 Test Summary", BLUE)
@@ -455,6 +479,7 @@ def main():
         print("4. Run: python debug_celery.py")
     
     print("="*60 + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
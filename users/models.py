@@ -6,16 +6,19 @@ class User(AbstractUser):
     Custom user model with role-based access control.
     """
     
-    ROLE_CHOICES = [
-        ('admin', 'Admin'),
-        ('analyst', 'Analyst'),
-        ('viewer', 'Viewer'),
-    ]
-    
+    class Role(models.TextChoices):
+        ADMIN = 'admin', 'Admin'
+        ANALYST = 'analyst', 'Analyst'
+        VIEWER = 'viewer', 'Viewer'
+
+    # Kept for callers that still reference the old list
+    ROLE_CHOICES = Role.choices
+
     role = models.CharField(
-        max_length=20,
-        choices=ROLE_CHOICES,
-        default='viewer',
+        max_length=16,
+        choices=Role.choices,
+        default=Role.VIEWER,
+        db_index=True,
         help_text="User role for permission management"
     )
     
@@ -46,12 +49,12 @@ class User(AbstractUser):
     
     @property
     def is_admin(self):
-        return self.role == 'admin'
-    
+        return self.role == self.Role.ADMIN
+
     @property
     def is_analyst(self):
-        return self.role in ['admin', 'analyst']
-    
+        return self.role in (self.Role.ADMIN, self.Role.ANALYST)
+
     @property
     def can_view_data(self):
-        return self.role in ['admin', 'analyst', 'viewer']
\ No newline at end of file
+        return self.role in (self.Role.ADMIN, self.Role.ANALYST, self.Role.VIEWER)
\ No newline at end of file